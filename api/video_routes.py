@@ -1,28 +1,58 @@
-from fastapi import APIRouter, Query, Path, status
+from fastapi import APIRouter, BackgroundTasks, Query, Path, status
 from typing import Optional
-import math
-import json
+import asyncio
+import msgpack
 
 from models import (
     ApiResponse, 
     CreateVideoRequest,
     BatchCreateVideoRequest,
-    VideoCreationResult,
     BatchCreationResponse,
-    PaginationData
+    VideoCreationResult,
+    PaginationData,
+    CursorPaginationData,
+    VideoOrderBy,
+    HighlightOrderBy,
+    FrameOrderBy
 )
 from database.db_access import DBAccess
+from database.connection import MYSQL_POOL_SIZE
 from utils.redis_util import RedisClient
 from config.settings import QUEUE_NAME_V1, QUEUE_NAME_V2, PROCESSOR_VERSION
 from config.log import logger
 
 
-router = APIRouter(prefix="/api/v1", tags=["videos"])
+# Mounted under the /api sub-application (see main.py), so the external
+# path stays /api/v1/...
+router = APIRouter(prefix="/v1", tags=["videos"])
 
 # Initialize dependencies
 db = DBAccess()
 redis_client = RedisClient.get_instance()
 
+# Max commands per Redis pipeline flush (per Redis pipelining guidance)
+PIPELINE_CHUNK_SIZE = 10_000
+
+# PROCESSOR_VERSION is a startup constant, so resolve the target queue and
+# payload builder once at import instead of re-comparing strings per video
+_PUSH_QUEUE = QUEUE_NAME_V2 if PROCESSOR_VERSION == "v2" else QUEUE_NAME_V1
+
+if PROCESSOR_VERSION == "v1":
+    def _queue_payload(video_id: int, original_url: str, highlight_url: str):
+        return str(video_id)
+elif PROCESSOR_VERSION == "v2":
+    def _queue_payload(video_id: int, original_url: str, highlight_url: str):
+        # msgpack emits compact binary bytes, which redis-py accepts
+        # directly; workers decode with msgpack.unpackb(raw, raw=False)
+        return msgpack.packb({
+            "video_id": video_id,
+            "original_url": original_url,
+            "highlight_url": highlight_url,
+        }, use_bin_type=True)
+else:
+    # Unknown version: keep the old behavior of not pushing at all
+    _queue_payload = None
+
 
 # ==================== Helper Functions ====================
 
@@ -48,7 +78,8 @@ def create_error_response(message: str, code: int = 400) -> ApiResponse:
 
 def create_pagination_data(items: list, total_items: int, current_page: int, page_size: int) -> PaginationData:
     """Create pagination data structure"""
-    total_pages = math.ceil(total_items / page_size) if page_size > 0 else 0
+    # Integer ceiling division: no float round-trip, exact for huge counts
+    total_pages = (total_items + page_size - 1) // page_size if page_size > 0 else 0
     
     return PaginationData(
         totalItems=total_items,
@@ -60,50 +91,54 @@ def create_pagination_data(items: list, total_items: int, current_page: int, pag
 
 # ==================== API 1: Create Video ====================
 
+def _push_video_job(video_id: int, original_url: str, highlight_url: str):
+    """Push a single job to the Redis queue (runs as a background task)"""
+    if _queue_payload is None:
+        return
+    try:
+        redis_client.lpush(_PUSH_QUEUE, _queue_payload(video_id, original_url, highlight_url))
+        logger.debug("Pushed video %s to %s", video_id, _PUSH_QUEUE)
+    except Exception as redis_error:
+        logger.error(f"Failed to push to Redis: {redis_error}")
+        # Note: Video is already in DB, so we don't fail the request
+        # But we log the error for monitoring
+
+
 @router.post("/videos", response_model=ApiResponse, status_code=status.HTTP_201_CREATED)
-async def create_video(request: CreateVideoRequest):
+async def create_video(request: CreateVideoRequest, background_tasks: BackgroundTasks):
     """
     Create new video and push to Redis queue
-    
+
     - **original_url**: URL of the original video
     - **highlight_url**: URL of the highlight video
     - **title**: Video title
     """
     try:
-        # 1. Insert into database
-        result = db.insert_video_info(
+        # 1. Insert into database on the thread pool; the response needs the
+        # generated ID, so the insert stays on the request path but no
+        # longer blocks the event loop
+        result = await db.insert_video_info_async(
             original_url=request.original_url,
             highlight_url=request.highlight_url,
             title=request.title
         )
-        
+
         if not result:
             logger.error("Failed to insert video into database")
             return create_error_response(
                 message="Failed to create video",
                 code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        
-        video_id = result.get("id")
-        
-        # 2. Push to Redis queue
-        try:
-            if PROCESSOR_VERSION == "v1":
-                redis_client.lpush(QUEUE_NAME_V1, str(video_id))
-                logger.info(f"Video ID {video_id} pushed to Redis queue: {QUEUE_NAME_V1}")
-            elif PROCESSOR_VERSION == "v2":
-                video_job_data = {
-                    "video_id": video_id,
-                    "original_url": request.original_url,
-                    "highlight_url": request.highlight_url,
-                }
-                redis_client.lpush(QUEUE_NAME_V2, json.dumps(video_job_data))
-                logger.info(f"Video ID {video_id} pushed to Redis queue: {QUEUE_NAME_V2}")
-        except Exception as redis_error:
-            logger.error(f"Failed to push to Redis: {redis_error}")
-            # Note: Video is already in DB, so we don't fail the request
-            # But we log the error for monitoring
-        
+
+        # Coerce to a plain int once: drivers may hand back Decimal/str,
+        # and a plain int takes the serializer's fast path in the payload
+        video_id = int(result["id"])
+
+        # 2. Defer the Redis push until after the response is sent
+        background_tasks.add_task(
+            _push_video_job, video_id, request.original_url, request.highlight_url
+        )
+
         # 3. Return success response
         return create_success_response(
             data=result,
@@ -133,69 +168,111 @@ async def batch_create_videos(request: BatchCreateVideoRequest):
     results = []
     success_count = 0
     failed_count = 0
-    
+    pushed_video_ids = []  # video ids whose payloads are queued for the pipelined flush
+    payloads = []  # serialized queue payloads, in insert order
+
     try:
-        # Process each video in the list
-        for idx, video_req in enumerate(request.videos):
-            try:
-                # 1. Insert into database
-                result = db.insert_video_info(
-                    original_url=video_req.original_url,
-                    highlight_url=video_req.highlight_url,
-                    title=video_req.title
-                )
-                
-                if not result:
-                    failed_count += 1
-                    results.append(VideoCreationResult(
-                        success=False,
-                        error="Failed to insert video into database",
-                        video_id=None,
-                        video_data=None
-                    ))
-                    logger.error(f"Failed to insert video #{idx + 1}: {video_req.title}")
-                    continue
-                
-                video_id = result.get("id")
-                
-                # 2. Push to Redis queue
-                try:
-                    if PROCESSOR_VERSION == "v1":
-                        redis_client.lpush(QUEUE_NAME_V1, str(video_id))
-                        logger.info(f"Video ID {video_id} pushed to Redis queue: {QUEUE_NAME_V1}")
-                    elif PROCESSOR_VERSION == "v2":
-                        video_job_data = {
-                            "video_id": video_id,
-                            "original_url": video_req.original_url,
-                            "highlight_url": video_req.highlight_url,
-                        }
-                        redis_client.lpush(QUEUE_NAME_V2, json.dumps(video_job_data))
-                        logger.info(f"Video ID {video_id} pushed to Redis queue: {QUEUE_NAME_V2}")
-                except Exception as redis_error:
-                    logger.warning(f"Failed to push video ID {video_id} to Redis: {redis_error}")
-                    # Video is already in DB, so we still count it as success
-                
-                # 3. Record success
-                success_count += 1
-                results.append(VideoCreationResult(
-                    success=True,
-                    video_id=video_id,
-                    video_data=result,
-                    error=None
-                ))
-                
-            except Exception as video_error:
+        # 1. Insert all videos with a single multi-row INSERT (one round-trip)
+        rows = [(v.original_url, v.highlight_url, v.title) for v in request.videos]
+        video_ids = await db.insert_video_info_batch_async(rows)
+
+        if video_ids is None:
+            # Fall back to per-video inserts if the batch insert failed.
+            # The inserts are independent, so overlap them on the thread
+            # pool, bounded so we never outrun the MySQL connection pool
+            logger.warning("Batch insert failed, falling back to per-video inserts")
+            sem = asyncio.Semaphore(min(MYSQL_POOL_SIZE, 16))
+
+            async def insert_one(video_req):
+                async with sem:
+                    return await db.insert_video_info_async(
+                        original_url=video_req.original_url,
+                        highlight_url=video_req.highlight_url,
+                        title=video_req.title
+                    )
+
+            inserted = await asyncio.gather(
+                *(insert_one(v) for v in request.videos),
+                return_exceptions=True
+            )
+
+            video_ids = []
+            for idx, inserted_row in enumerate(inserted):
+                if isinstance(inserted_row, Exception):
+                    logger.error(f"Error processing video #{idx + 1}: {inserted_row}")
+                    video_ids.append(None)
+                else:
+                    video_ids.append(inserted_row.get("id") if inserted_row else None)
+
+        # 2. Build per-video results and queue payloads
+        for idx, (video_req, video_id) in enumerate(zip(request.videos, video_ids)):
+            if video_id is None:
                 failed_count += 1
-                results.append(VideoCreationResult(
+                # model_construct keeps the zero-validation path while
+                # matching the List[VideoCreationResult] annotation, so
+                # the pydantic serializer doesn't warn about raw dicts
+                results.append(VideoCreationResult.model_construct(
                     success=False,
-                    error=str(video_error),
                     video_id=None,
+                    error="Failed to insert video into database",
                     video_data=None
                 ))
-                logger.error(f"Error processing video #{idx + 1}: {video_error}")
-        
-        # 4. Create batch response
-        batch_response = BatchCreationResponse(
+                logger.error(f"Failed to insert video #{idx + 1}: {video_req.title}")
+                continue
+
+            result = {
+                "id": video_id,
+                "original_url": video_req.original_url,
+                "highlight_url": video_req.highlight_url,
+                "title": video_req.title,
+                "status": 0
+            }
+
+            if _queue_payload is not None:
+                pushed_video_ids.append(video_id)
+                payloads.append(_queue_payload(
+                    video_id, video_req.original_url, video_req.highlight_url
+                ))
+
+            success_count += 1
+            results.append(VideoCreationResult.model_construct(
+                success=True,
+                video_id=video_id,
+                error=None,
+                video_data=result
+            ))
+
+        # 3. Push all jobs to Redis with one variadic LPUSH per chunk.
+        # LPUSH(key, a, b, c) inserts in argument order, identical to the
+        # previous one-LPUSH-per-video loop, so worker pop order is unchanged.
+        try:
+            # One pipeline for the whole request: a batch within the chunk
+            # size (the common case, max_items=100) is a single connection
+            # checkout and a single flush, instead of re-acquiring a pooled
+            # connection - and re-doing TLS records on Redis Cloud - per push
+            with redis_client.pipeline() as pipe:
+                for start in range(0, len(payloads), PIPELINE_CHUNK_SIZE):
+                    chunk = payloads[start:start + PIPELINE_CHUNK_SIZE]
+                    chunk_ids = pushed_video_ids[start:start + PIPELINE_CHUNK_SIZE]
+                    pipe.lpush(_PUSH_QUEUE, *chunk)
+                    responses = pipe.execute(raise_on_error=False)
+
+                    # Videos are already in DB, so a failed push is logged
+                    # but still counted as success
+                    if responses and isinstance(responses[0], Exception):
+                        logger.warning("Failed to push video IDs %s to Redis: %s", chunk_ids, responses[0])
+                    else:
+                        logger.debug("Pushed video IDs %s to %s", chunk_ids, _PUSH_QUEUE)
+
+            # One aggregate line per batch instead of one INFO per video
+            logger.info("Pushed %d video jobs to %s", len(payloads), _PUSH_QUEUE)
+        except Exception as redis_error:
+            logger.warning(f"Failed to push batch to Redis: {redis_error}")
+
+        # 4. Create batch response. The data is built right here from
+        # trusted values, so model_construct skips re-running a validator
+        # over every per-video result dict
+        batch_response = BatchCreationResponse.model_construct(
             total=len(request.videos),
             success_count=success_count,
             failed_count=failed_count,
@@ -211,7 +288,7 @@ async def batch_create_videos(request: BatchCreateVideoRequest):
             message = "All videos failed to create"
         
         return create_success_response(
-            data=batch_response.dict(),
+            data=batch_response,
             message=message,
             code=status.HTTP_201_CREATED
         )
@@ -230,10 +307,11 @@ async def batch_create_videos(request: BatchCreateVideoRequest):
 async def get_videos(
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     size: int = Query(10, ge=1, le=100, description="Items per page"),
-    order_by: str = Query("id", description="Column to sort by (id, title, status)"),
+    order_by: VideoOrderBy = Query(VideoOrderBy.id, description="Column to sort by (id, title, status)"),
     order_direction: str = Query("desc", pattern="^(asc|desc)$", description="Sort direction"),
     status_filter: Optional[int] = Query(None, description="Filter by status"),
-    query: Optional[str] = Query(None, description="Search by title")
+    query: Optional[str] = Query(None, description="Search by title"),
+    cursor: Optional[int] = Query(None, ge=1, description="Keyset cursor: return videos with id < cursor (ignores page/order_by)")
 ):
     """
     Get paginated list of videos with search and sorting
@@ -244,24 +322,37 @@ async def get_videos(
     - **order_direction**: asc or desc (default: desc)
     - **status_filter**: Filter by status (optional)
     - **query**: Search in title (optional)
+    - **cursor**: Keyset cursor from a previous response's nextCursor;
+      when set, the response carries nextCursor instead of totalPages
+      and no COUNT(*) is issued (fixed id DESC order)
     """
     try:
-        # 1. Get videos list
-        videos = db.get_video_page(
+        # Keyset path: seek directly to id < cursor, skip COUNT(*) entirely
+        if cursor is not None:
+            videos = await db.get_video_page_after_async(
+                cursor=cursor,
+                size=size,
+                status=status_filter,
+                query=query
+            )
+            next_cursor = videos[-1].id if len(videos) == size else None
+            return create_success_response(
+                data=CursorPaginationData(nextCursor=next_cursor, items=videos),
+                message="Videos retrieved successfully",
+                code=status.HTTP_200_OK
+            )
+
+        # 1+2. One query returns the page rows and the total via
+        # COUNT(*) OVER(), so no separate COUNT round-trip is needed
+        videos, total_count = await db.get_video_page_async(
             page=page,
             size=size,
-            order_by=order_by,
+            order_by=order_by.value,
             order_direction=order_direction,
             status=status_filter,
             query=query
         )
-        
-        # 2. Get total count
-        total_count = db.get_video_count(
-            query=query,
-            status=status_filter
-        )
-        
+
         # 3. Create pagination data
         pagination_data = create_pagination_data(
             items=videos,
@@ -271,8 +362,10 @@ async def get_videos(
         )
         
         # 4. Return success response
+        # Pass the model through as-is; pydantic serializes it once on the
+        # way out instead of materializing an intermediate dict first
         return create_success_response(
-            data=pagination_data.dict(),
+            data=pagination_data,
             message="Videos retrieved successfully",
             code=status.HTTP_200_OK
         )
@@ -292,31 +385,46 @@ async def get_video_highlights(
     video_id: int = Path(..., ge=1, description="Video ID"),
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     size: int = Query(10, ge=1, le=100, description="Items per page"),
-    order_by: str = Query("id", description="Column to sort by"),
-    order_direction: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction")
+    order_by: HighlightOrderBy = Query(HighlightOrderBy.id, description="Column to sort by"),
+    order_direction: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
+    cursor: Optional[int] = Query(None, ge=1, description="Keyset cursor: return highlights with id < cursor (ignores page/order_by)")
 ):
     """
     Get paginated list of highlights for a specific video
-    
+
     - **video_id**: ID of the video
     - **page**: Page number (default: 1)
     - **size**: Items per page (default: 10, max: 100)
     - **order_by**: Sort column (default: id)
     - **order_direction**: asc or desc (default: desc)
+    - **cursor**: Keyset cursor from a previous response's nextCursor;
+      when set, the response carries nextCursor instead of totalPages
+      and no COUNT(*) is issued (fixed id DESC order)
     """
     try:
-        # 1. Get highlights list
-        highlights = db.get_highlight_page(
+        # Keyset path: seek directly to id < cursor, skip COUNT(*) entirely
+        if cursor is not None:
+            highlights = await db.get_highlight_page_after_async(
+                video_id=video_id,
+                cursor=cursor,
+                size=size
+            )
+            next_cursor = highlights[-1].id if len(highlights) == size else None
+            return create_success_response(
+                data=CursorPaginationData(nextCursor=next_cursor, items=highlights),
+                message="Highlights retrieved successfully",
+                code=status.HTTP_200_OK
+            )
+
+        # 1+2. One query returns the page rows and the total (COUNT(*) OVER())
+        highlights, total_count = await db.get_highlight_page_async(
             video_id=video_id,
             page=page,
             size=size,
-            order_by=order_by,
+            order_by=order_by.value,
             order_direction=order_direction
         )
-        
-        # 2. Get total count
-        total_count = db.get_highlight_count(video_id=video_id)
-        
+
         # 3. Create pagination data
         pagination_data = create_pagination_data(
             items=highlights,
@@ -326,8 +434,10 @@ async def get_video_highlights(
         )
         
         # 4. Return success response
+        # Pass the model through as-is; pydantic serializes it once on the
+        # way out instead of materializing an intermediate dict first
         return create_success_response(
-            data=pagination_data.dict(),
+            data=pagination_data,
             message="Highlights retrieved successfully",
             code=status.HTTP_200_OK
         )
@@ -346,7 +456,7 @@ async def get_highlight_frames(
     highlight_id: int = Path(..., ge=1, description="Highlight ID"),
     page: int = Query(1, ge=1, description="Page number (starts from 1)"),
     size: int = Query(10, ge=1, le=100, description="Items per page"),
-    order_by: str = Query("id", description="Column to sort by"),
+    order_by: FrameOrderBy = Query(FrameOrderBy.id, description="Column to sort by"),
     order_direction: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction")
 ):
     """
@@ -359,18 +469,15 @@ async def get_highlight_frames(
     - **order_direction**: asc or desc (default: asc)
     """
     try:
-        # 1. Get frames list
-        frames = db.get_frame_page(
+        # 1+2. One query returns the page rows and the total (COUNT(*) OVER())
+        frames, total_count = await db.get_frame_page_async(
             highlight_id=highlight_id,
             page=page,
             size=size,
-            order_by=order_by,
+            order_by=order_by.value,
             order_direction=order_direction
         )
-        
-        # 2. Get total count
-        total_count = db.get_frame_count(highlight_id=highlight_id)
-        
+
         # 3. Create pagination data
         pagination_data = create_pagination_data(
             items=frames,
@@ -380,8 +487,10 @@ async def get_highlight_frames(
         )
         
         # 4. Return success response
+        # Pass the model through as-is; pydantic serializes it once on the
+        # way out instead of materializing an intermediate dict first
         return create_success_response(
-            data=pagination_data.dict(),
+            data=pagination_data,
             message="Frames retrieved successfully",
             code=status.HTTP_200_OK
         )
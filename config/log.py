@@ -1,6 +1,8 @@
+import atexit
 import os
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 
 def setup_logger(name, log_file, level=logging.DEBUG):
     logger = logging.getLogger(name)
@@ -16,22 +18,36 @@ def setup_logger(name, log_file, level=logging.DEBUG):
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
     # 2. Handler ghi ra FILE (xoay vòng theo ngày)
+    # delay=True: file chỉ được mở khi có record đầu tiên, import module
+    # không đụng tới filesystem (quan trọng khi chạy uvicorn --workers N)
     file_handler = TimedRotatingFileHandler(
-        log_file, when='midnight', interval=1, backupCount=7, encoding='utf-8', utc=True
+        log_file, when='midnight', interval=1, backupCount=7, encoding='utf-8',
+        utc=True, delay=True
     )
     file_handler.suffix = '%Y%m%d'
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # 3. Handler ghi ra MÀN HÌNH (Console)
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # 4. Ghi log qua queue: caller chỉ đẩy record vào queue, còn I/O
+    # (write file, flush console) chạy trên thread riêng của listener
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
 log_file_path = 'logs/app.log'
 logger = setup_logger("highlight-vmaf-api", log_file_path)
 
-# Test thử
-logger.info("Hệ thống bắt đầu chạy...")
\ No newline at end of file
+
+def init_logging():
+    """Log dòng khởi động - gọi MỘT lần từ main.py, không chạy khi import"""
+    logger.info("Hệ thống bắt đầu chạy...")
@@ -1,6 +1,9 @@
 import os
 import socket
 import logging
+from functools import lru_cache
+
+import redis
 
 
 logger = logging.getLogger(__name__)
@@ -18,9 +21,13 @@ class RedisConfig:
     PORT = int(os.getenv("REDIS_PORT", "6379"))
     USERNAME = os.getenv("REDIS_USERNAME", "default")
     DB = int(os.getenv("REDIS_DB", "0"))
-    
+
+    # Optional: Unix domain socket for co-located Redis - skips the
+    # TCP/IP stack entirely (no handshake, no keepalive needed)
+    UNIX_SOCKET_PATH = os.getenv("REDIS_UNIX_SOCKET_PATH")
+
     # Validate required fields
-    if not HOST:
+    if not HOST and not UNIX_SOCKET_PATH:
         raise ValueError(
             "REDIS_HOST is required.\n"
             "Set it in .env file: REDIS_HOST=redis-15129.c9.us-east-1-4.ec2.cloud.redislabs.com"
@@ -29,20 +36,27 @@ class RedisConfig:
     # =========================================================================
     # 2. PASSWORD & SECURITY
     # =========================================================================
-    @staticmethod
-    def _get_password() -> str:
-        """Get and optionally decrypt Redis password"""
+    @classmethod
+    @lru_cache(maxsize=1)
+    def password(cls) -> str:
+        """
+        Get and optionally decrypt Redis password.
+
+        Computed lazily on the first connection setup and cached, so
+        importing the config stays cheap and any future decryption only
+        runs when the password is actually needed.
+        """
         raw_password = os.getenv("REDIS_PASSWORD")
-        
+
         if not raw_password:
             raise ValueError(
                 "REDIS_PASSWORD is required.\n"
                 "Set it in .env file: REDIS_PASSWORD=your_password"
             )
-        
+
         # Check if password needs decryption
         decrypt_enabled = os.getenv("REDIS_PASSWORD_ENCRYPTED", "false").lower() == "true"
-        
+
         if decrypt_enabled:
             try:
                 logger.info("Decrypting Redis password...")
@@ -50,13 +64,11 @@ class RedisConfig:
             except Exception as e:
                 logger.error(f"Password decryption failed: {e}")
                 raise ValueError("Invalid encrypted password") from e
-        
+
         # Return raw password
         logger.info("Using plaintext password (REDIS_PASSWORD_ENCRYPTED=false)")
         return raw_password
     
-    PASSWORD = _get_password.__func__()
-    
     # =========================================================================
     # 3. SSL/TLS (Important for Redis Cloud Production)
     # =========================================================================
@@ -111,9 +123,9 @@ class RedisConfig:
     def validate(cls) -> bool:
         """Validate all configuration settings"""
         try:
-            assert cls.HOST, "REDIS_HOST is not set"
+            assert cls.HOST or cls.UNIX_SOCKET_PATH, "REDIS_HOST is not set"
             assert cls.PORT > 0, "Invalid REDIS_PORT"
-            assert cls.PASSWORD, "REDIS_PASSWORD is not set"
+            assert cls.password(), "REDIS_PASSWORD is not set"
             assert cls.SOCKET_TIMEOUT > 0, "Invalid REDIS_SOCKET_TIMEOUT"
             assert cls.MAX_CONNECTIONS > 0, "Invalid REDIS_MAX_CONNECTIONS"
             
@@ -133,36 +145,72 @@ class RedisConfig:
             logger.error(f"❌ Redis configuration validation failed: {e}")
             raise
     
+    # Cached connection params/pool - the config is read once from env,
+    # so there is no reason to rebuild the dict (or re-log) per call
+    _CONNECTION_PARAMS = None
+    _CONNECTION_POOL = None
+
     @classmethod
     def get_connection_params(cls) -> dict:
         """
-        Get all connection parameters for Redis client
-        
+        Get all connection parameters for Redis client (built once, cached)
+
         Returns:
             dict: Connection parameters ready for Redis(**params)
         """
-        params = {
-            "host": cls.HOST,
-            "port": cls.PORT,
-            "username": cls.USERNAME,
-            "password": cls.PASSWORD,
-            "db": cls.DB,
-            "decode_responses": cls.DECODE_RESPONSES,
-            "socket_timeout": cls.SOCKET_TIMEOUT,
-            "socket_connect_timeout": cls.SOCKET_CONNECT_TIMEOUT,
-            "max_connections": cls.MAX_CONNECTIONS,
-            "socket_keepalive": cls.SOCKET_KEEPALIVE,
-            "socket_keepalive_options": cls.SOCKET_KEEPALIVE_OPTIONS,
-            "health_check_interval": cls.HEALTH_CHECK_INTERVAL,
-        }
-        
-        # Add SSL if enabled
-        if cls.SSL_ENABLED:
-            params["ssl"] = True
-            params["ssl_cert_reqs"] = cls.SSL_CERT_REQS
-            logger.info("🔒 SSL/TLS enabled for Redis connection")
-        
-        return params
+        if cls._CONNECTION_PARAMS is None:
+            params = {
+                "username": cls.USERNAME,
+                "password": cls.password(),
+                "db": cls.DB,
+                "decode_responses": cls.DECODE_RESPONSES,
+                "socket_timeout": cls.SOCKET_TIMEOUT,
+                "socket_connect_timeout": cls.SOCKET_CONNECT_TIMEOUT,
+                "max_connections": cls.MAX_CONNECTIONS,
+                "health_check_interval": cls.HEALTH_CHECK_INTERVAL,
+            }
+
+            if cls.UNIX_SOCKET_PATH:
+                # Co-located Redis: talk over the Unix socket, no TCP
+                # handshake and no TCP keepalive options to set
+                params["unix_socket_path"] = cls.UNIX_SOCKET_PATH
+                logger.info(f"🔌 Using Unix socket for Redis: {cls.UNIX_SOCKET_PATH}")
+            else:
+                params["host"] = cls.HOST
+                params["port"] = cls.PORT
+                params["socket_keepalive"] = cls.SOCKET_KEEPALIVE
+                params["socket_keepalive_options"] = cls.SOCKET_KEEPALIVE_OPTIONS
+
+                # Add SSL if enabled (logged once here, not per call)
+                if cls.SSL_ENABLED:
+                    params["ssl"] = True
+                    params["ssl_cert_reqs"] = cls.SSL_CERT_REQS
+                    logger.info("🔒 SSL/TLS enabled for Redis connection")
+
+            cls._CONNECTION_PARAMS = params
+
+        return cls._CONNECTION_PARAMS
+
+    @classmethod
+    def get_connection_pool(cls) -> "redis.ConnectionPool":
+        """
+        Get the shared ConnectionPool (created once, reused by every consumer)
+
+        Returns:
+            redis.ConnectionPool: Shared pool built from the cached params
+        """
+        if cls._CONNECTION_POOL is None:
+            params = dict(cls.get_connection_params())
+            # ConnectionPool selects the transport via connection_class,
+            # not ssl=True / unix_socket_path
+            if "unix_socket_path" in params:
+                params["path"] = params.pop("unix_socket_path")
+                params["connection_class"] = redis.UnixDomainSocketConnection
+            elif params.pop("ssl", False):
+                params["connection_class"] = redis.SSLConnection
+            cls._CONNECTION_POOL = redis.ConnectionPool(**params)
+
+        return cls._CONNECTION_POOL
     
     # ✅ THÊM method này
     @classmethod
@@ -23,6 +23,16 @@ QUEUE_NAME_V2 = os.getenv('VIDEO_JOB_QUEUE', 'queue:video_jobs')
 BLPOP_TIMEOUT = int(os.getenv('BLPOP_TIMEOUT', '20'))  # seconds
 ROI = os.getenv('ROI', '0,0,500,300')  # Default full HD
 
+# CORS: danh sách origin tường minh (phẩy ngăn cách) để starlette đi
+# đường so khớp nhanh; credentials mặc định tắt nên preflight cache
+# được phía browser (Access-Control-Max-Age)
+CORS_ALLOW_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv('CORS_ALLOW_ORIGINS', '*').split(',')
+    if origin.strip()
+]
+CORS_ALLOW_CREDENTIALS = os.getenv('CORS_ALLOW_CREDENTIALS', 'false').lower() == 'true'
+
 CONFIG_FOLDER = "profiles/cpu"
 
 VMAF_MODEL_PATH = "model/vmaf_v0.6.1.json"
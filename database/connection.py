@@ -1,25 +1,90 @@
+import os
+import threading
+import time
+
 from mysql.connector import pooling, Error
 from config.settings import *
 from config.log import logger
 
+# Số connection giữ trong pool. Mặc định theo công thức core_count*2+1
+# cho workload OLTP I/O-bound (query ngắn, chờ network là chính);
+# override bằng MYSQL_POOL_SIZE khi cần. mysql-connector giới hạn cứng
+# pool_size <= 32 (CNX_POOL_MAXSIZE) nên luôn clamp về mức đó
+_MYSQL_POOL_MAX = 32
+MYSQL_POOL_SIZE = min(
+    int(os.getenv("MYSQL_POOL_SIZE", str((os.cpu_count() or 1) * 2 + 1))),
+    _MYSQL_POOL_MAX
+)
+
+# Timeout bắt tay TCP với MySQL - để burst không xếp hàng chờ vô hạn
+MYSQL_CONNECT_TIMEOUT = int(os.getenv("MYSQL_CONNECT_TIMEOUT", "5"))
+
+# Khoảng nghỉ giữa hai lần thử dựng lại pool khi MySQL down - tránh mỗi
+# request đều trả giá một lần connect timeout
+_POOL_RETRY_INTERVAL = 5.0  # seconds
+
 class MySQLConnectionPool:
-    def __init__(self):
+    """
+    Pool kết nối MySQL dùng chung - singleton toàn process: mọi nơi gọi
+    MySQLConnectionPool() đều nhận CÙNG một instance (pooling.MySQLConnectionPool
+    fill đủ pool_size connection ngay lúc dựng, nên mỗi instance thừa là
+    thừa nguyên một pool connection idle).
+
+    - pool_size = core_count * 2 + 1: đủ lớn để che network wait của các
+      query OLTP ngắn mà không tạo thread thrash phía server.
+    - pool_reset_session=False: bỏ round-trip COM_RESET_CONNECTION mỗi
+      lần trả connection về pool; code hiện tại không đổi session state
+      (không SET/USE/temp table) nên reset là phí vô ích.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.pool = None
+                    instance._retry_at = 0.0
+                    instance._init_pool()
+                    cls._instance = instance
+        return cls._instance
+
+    def _init_pool(self):
+        # Khi MySQL chưa sẵn sàng lúc boot, pool = None và app chạy chế
+        # độ degraded; get_connection trả None thay vì AttributeError
         try:
             # Khởi tạo MySQLConnectionPool
             self.pool = pooling.MySQLConnectionPool(
-                pool_name="mypool",
-                pool_size=2,
-                pool_reset_session=True,
+                pool_name="vmaf",
+                pool_size=MYSQL_POOL_SIZE,
+                pool_reset_session=False,
                 host=MYSQL_HOST,
                 port=MYSQL_PORT,
                 user=MYSQL_USER,
                 password=MYSQL_PASS,
-                database=MYSQL_DB
+                database=MYSQL_DB,
+                connection_timeout=MYSQL_CONNECT_TIMEOUT,
+                # C extension (_mysql_connector, có sẵn trong wheel chính
+                # thức): decode protocol/row bằng C thay vì Python thuần
+                use_pure=False
             )
         except Error as e:
             logger.error(f"Error while connecting to MySQL using Connection pool: {e}")
 
     def get_connection(self):
+        if self.pool is None:
+            # MySQL có thể đã sống lại sau khi boot degraded - thử dựng
+            # lại pool, có cooldown để cả đàn request không cùng trả giá
+            # một lần connect timeout
+            with self._lock:
+                if self.pool is None and time.monotonic() >= self._retry_at:
+                    self._retry_at = time.monotonic() + _POOL_RETRY_INTERVAL
+                    self._init_pool()
+            if self.pool is None:
+                logger.error("MySQL pool is not initialized (DB unreachable?)")
+                return None
         try:
             return self.pool.get_connection()  # Trả về kết nối từ pool
         except Error as e:
@@ -1,12 +1,86 @@
+import asyncio
+import hashlib
+import time
+
 from mysql.connector import Error
 from database.connection import MySQLConnectionPool
+from utils.redis_util import RedisClient
 from config.log import logger
+from models import VideoInfo, HighlightStats, FrameInfo
+
+# COUNT(*) đắt (nhất là với LIKE) nhưng được gọi lại y hệt ở mỗi lần
+# chuyển trang -> cache ngắn hạn trong Redis, chấp nhận trễ vài chục giây
+COUNT_CACHE_TTL = 20  # seconds
+
+# Version counter: INCR mỗi lần insert video để key cache đếm cũ tự chết
+_VIDEO_COUNT_VERSION_KEY = "cnt:video:ver"
+
+# Cache TTL ngắn cho get_job_by_id: row status=0 là bất biến và worker
+# poll lặp lại cùng một job id trong vài giây -> hit là khỏi round-trip
+_JOB_CACHE_TTL = 5.0  # seconds
+_JOB_CACHE_MAX = 1024
+_job_cache = {}  # job_id -> (expires_at, row)
+
+# Số dòng tối đa mỗi câu multi-row INSERT (giữ câu lệnh gọn dưới
+# max_allowed_packet; trùng với max_items của BatchCreateVideoRequest)
+_INSERT_BATCH_SIZE = 100
+
+# Cột trả về tường minh thay cho SELECT *: ít byte trên wire, ít cột
+# phải decode, và cho phép covering index phục vụ query không cần lookup
+_VIDEO_COLUMNS = "id, original_url, highlight_url, title, status"
+_STATS_COLUMNS = "id, video_id, vmaf_mean, vmaf_min, vmaf_max, duration, start_time, end_time"
+_FRAME_COLUMNS = "id, highlight_id, frame_num, vmaf, origin_url, highlight_url"
+
+# Whitelist cột sort dạng frozenset (O(1) hash lookup, build một lần ở
+# import thay vì cấp phát list mỗi call) + map chuẩn hoá hướng sort
+_VIDEO_SORT_COLS = frozenset({"id", "title", "status", "original_url", "highlight_url"})
+_STATS_SORT_COLS = frozenset({"id", "video_id", "vmaf_mean", "vmaf_min", "vmaf_max", "duration"})
+_FRAME_SORT_COLS = frozenset({"id", "highlight_id", "frame_num", "vmaf", "origin_url", "highlight_url"})
+_DIRECTIONS = {"asc": "ASC", "desc": "DESC"}
+
+# Cache chuỗi SQL của các query phân trang: tập biến thể
+# (order_by, direction, filter) là hữu hạn nên memoize được; server-side
+# nhờ đó cũng chỉ thấy một bộ câu lệnh cố định, tái dùng được parse/plan
+_SQL_CACHE = {}
 
 
 class DBAccess:
     def __init__(self):
         self.pool = MySQLConnectionPool()
 
+    ############################################################################
+    # Cache đếm: mọi lỗi Redis đều coi như cache miss, không bao giờ làm
+    # hỏng đường đi chính xuống MySQL
+
+    @staticmethod
+    def _cache_get_int(key):
+        try:
+            val = RedisClient.get_instance().get(key)
+            return int(val) if val is not None else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _cache_set_int(key, value, ttl):
+        try:
+            RedisClient.get_instance().set(key, value, timeout=ttl)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _video_count_version():
+        try:
+            return RedisClient.get_instance().get(_VIDEO_COUNT_VERSION_KEY) or "0"
+        except Exception:
+            return "0"
+
+    @staticmethod
+    def _bump_video_count_version():
+        try:
+            RedisClient.get_instance().incr(_VIDEO_COUNT_VERSION_KEY)
+        except Exception:
+            pass
+
     def execute_query(self, query, params=None):
         connection = self.pool.get_connection()
         if connection is None:
@@ -65,26 +139,49 @@ class DBAccess:
         return where_clause, params
 
     def get_job_by_id(self, job_id):
-        sql = "SELECT * FROM video_info WHERE id = %s and status = 0"
-        
+        sql = f"SELECT {_VIDEO_COLUMNS} FROM video_info WHERE id = %s and status = 0"
+
+        # 0. Cache TTL ngắn (xem _JOB_CACHE_TTL ở đầu file)
+        now = time.monotonic()
+        cached = _job_cache.get(job_id)
+        if cached is not None:
+            expires_at, row = cached
+            if expires_at > now:
+                return row
+            _job_cache.pop(job_id, None)
+
         # Sử dụng 'with' để đảm bảo connection luôn được trả lại pool
         try:
             with self.pool.get_connection() as connection:
                 if not connection:
                     logger.error("Could not get connection from pool")
                     return None
-                
+
+                # Cursor thường, KHÔNG prepared=True: cursor mở mới mỗi
+                # call nên prepared chỉ thêm round-trip PREPARE/DEALLOCATE
+                # mà không bao giờ được tái dùng
                 with connection.cursor(dictionary=True) as cursor:
                     cursor.execute(sql, (job_id,))
                     result = cursor.fetchone() # Fetchone hiệu quả hơn fetchall()[0]
+
+                    # Chặn cache phình vô hạn (hiếm khi chạm tới)
+                    if len(_job_cache) >= _JOB_CACHE_MAX:
+                        _job_cache.clear()
+                    _job_cache[job_id] = (now + _JOB_CACHE_TTL, result)
+
                     return result
-                    
+
         except Error as e:
             logger.error(f"Database error in get_job_by_id: {e}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error in get_job_by_id: {e}")
             return None
+
+    @staticmethod
+    def invalidate_job(job_id):
+        """Gọi khi worker đổi status của job để bỏ bản cache cũ ngay"""
+        _job_cache.pop(job_id, None)
         
     def insert_video_info(self, original_url, highlight_url, title):
         sql = "INSERT INTO video_info (original_url, highlight_url, title, status) VALUES (%s, %s, %s, 0)"
@@ -98,7 +195,10 @@ class DBAccess:
                 with connection.cursor() as cursor:
                     cursor.execute(sql, (original_url, highlight_url, title))
                     connection.commit()
-                    
+
+                    # Video mới -> cache đếm theo version cũ hết hiệu lực
+                    self._bump_video_count_version()
+
                     # Lấy ID vừa được sinh ra
                     new_id = cursor.lastrowid
                     
@@ -114,44 +214,190 @@ class DBAccess:
         except Error as e:
             logger.error(f"Error executing insert: {e}")
             return None
-        
-    def get_video_page(self, page=1, size=10, order_by='id', order_direction='desc', 
+
+    def insert_video_info_batch(self, rows):
+        """
+        Insert nhiều video trong MỘT câu INSERT (executemany) + 1 commit.
+        :param rows: list các tuple (original_url, highlight_url, title).
+        :return: list ID vừa sinh ra (cùng thứ tự với rows), hoặc None nếu lỗi.
+
+        Lưu ý: với InnoDB (innodb_autoinc_lock_mode=1), một câu multi-row
+        INSERT được cấp dải auto-increment liên tục, nên ID suy ra được từ
+        cursor.lastrowid + len(rows).
+        """
+        if not rows:
+            return []
+
+        sql = "INSERT INTO video_info (original_url, highlight_url, title, status) VALUES (%s, %s, %s, 0)"
+
+        try:
+            with self.pool.get_connection() as connection:
+                if not connection:
+                    return None
+
+                ids = []
+                with connection.cursor() as cursor:
+                    # Chia theo _INSERT_BATCH_SIZE để mỗi câu INSERT nằm
+                    # trong max_allowed_packet; vẫn chỉ commit MỘT lần
+                    for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+                        chunk = rows[start:start + _INSERT_BATCH_SIZE]
+                        cursor.executemany(sql, chunk)
+                        first_id = cursor.lastrowid
+                        ids.extend(range(first_id, first_id + len(chunk)))
+                    connection.commit()
+
+                    # Video mới -> cache đếm theo version cũ hết hiệu lực
+                    self._bump_video_count_version()
+
+                return ids
+
+        except Error as e:
+            logger.error(f"Error executing batch insert: {e}")
+            return None
+
+    def get_video_page(self, page=1, size=10, order_by='id', order_direction='desc',
                        status=None, query=None):
-        
-        # 1. Validate cột sort (Chống SQL Injection)
-        valid_columns = ["id", "title", "status", "original_url", "highlight_url"]
-        if order_by not in valid_columns:
+        """
+        Lấy một trang video kèm tổng số dòng trong CÙNG một query
+        (COUNT(*) OVER() - window function, MySQL 8+).
+        :return: tuple (rows, total) - 1 round-trip thay vì page + count.
+        """
+        # 1. Validate cột sort (Chống SQL Injection) - frozenset/dict
+        # module-level nên chỉ còn hai hash lookup mỗi call
+        if order_by not in _VIDEO_SORT_COLS:
             order_by = "id"
-        if order_direction.lower() not in ["asc", "desc"]:
-            order_direction = "desc"
+        order_direction = _DIRECTIONS.get(order_direction.lower(), "DESC")
 
         # 2. Lấy điều kiện lọc từ hàm helper
         where_clause, params = self._build_filter_query(status, query)
 
-        # 3. Xây dựng câu SQL hoàn chỉnh
-        sql = f"SELECT * FROM video_info{where_clause} ORDER BY {order_by} {order_direction}"
+        # 3. Xây dựng câu SQL hoàn chỉnh (memoize theo biến thể)
+        sql_key = ("video_page", order_by, order_direction, where_clause)
+        sql = _SQL_CACHE.get(sql_key)
+        if sql is None:
+            sql = (f"SELECT {_VIDEO_COLUMNS}, COUNT(*) OVER() AS _total FROM video_info{where_clause}"
+                   f" ORDER BY {order_by} {order_direction} LIMIT %s OFFSET %s")
+            _SQL_CACHE[sql_key] = sql
 
         # 4. Tính toán phân trang
         limit = int(size)
         offset = (int(page) - 1) * limit
-        
-        sql += " LIMIT %s OFFSET %s"
         # Lưu ý: params của WHERE phải đứng trước params của LIMIT/OFFSET
         params.extend([limit, offset])
 
         try:
             with self.pool.get_connection() as connection:
                 if not connection:
-                    return []
-                with connection.cursor(dictionary=True) as cursor:
+                    return [], 0
+                # Cursor thường trả tuple: không cấp phát dict + hash
+                # key cho từng cột; model_construct bỏ qua validation
+                # pydantic (dữ liệu từ DB đã tin cậy)
+                with connection.cursor() as cursor:
                     cursor.execute(sql, tuple(params))
-                    return cursor.fetchall()
+                    rows = cursor.fetchall()
+                    if rows:
+                        total = int(rows[0][-1])
+                    elif offset > 0:
+                        # Trang vượt quá cuối: window rỗng nên
+                        # COUNT(*) OVER() không trả tổng - rơi về query
+                        # đếm riêng (hiếm, và đã có cache Redis)
+                        total = self.get_video_count(query=query, status=status)
+                    else:
+                        total = 0
+                    items = [
+                        VideoInfo.model_construct(
+                            id=r[0], original_url=r[1], highlight_url=r[2],
+                            title=r[3], status=r[4]
+                        )
+                        for r in rows
+                    ]
+                    return items, total
         except Error as e:
             logger.error(f"Error fetching video page: {e}")
-            return []
+            return [], 0
         
+    def get_video_page_after(self, cursor=None, size=10, status=None, query=None):
+        """
+        Phân trang kiểu keyset/seek: lấy `size` video có id < cursor,
+        sắp xếp id DESC. Chi phí không đổi ở mọi độ sâu trang và không
+        cần COUNT(*) đi kèm.
+        :param cursor: id cuối cùng của trang trước (None = trang đầu).
+        """
+        where_clause, params = self._build_filter_query(status, query)
+
+        if cursor is not None:
+            if where_clause:
+                where_clause += " AND id < %s"
+            else:
+                where_clause = " WHERE id < %s"
+            params.append(cursor)
+
+        sql = f"SELECT {_VIDEO_COLUMNS} FROM video_info{where_clause} ORDER BY id DESC LIMIT %s"
+        params.append(int(size))
+
+        try:
+            with self.pool.get_connection() as connection:
+                if not connection:
+                    return []
+                with connection.cursor() as db_cursor:
+                    db_cursor.execute(sql, tuple(params))
+                    return [
+                        VideoInfo.model_construct(
+                            id=r[0], original_url=r[1], highlight_url=r[2],
+                            title=r[3], status=r[4]
+                        )
+                        for r in db_cursor.fetchall()
+                    ]
+        except Error as e:
+            logger.error(f"Error fetching video page (keyset): {e}")
+            return []
+
+    def iter_video_page(self, size=1000, order_by='id', order_direction='desc',
+                        status=None, query=None):
+        """
+        Generator stream từng dòng video bằng cursor KHÔNG buffer:
+        driver đọc row nào trả row đó thay vì fetchall() cả trang vào
+        RAM trước. Dành cho consumer nội bộ cần quét trang lớn
+        (export, backfill); API công khai giữ nguyên get_video_page vì
+        size bị chặn <= 100, generator ở cỡ đó chỉ thêm overhead.
+
+        Lưu ý: connection bị giữ tới khi generator chạy cạn hoặc bị
+        close - đừng giữ generator sống lâu giữa chừng.
+        """
+        if order_by not in _VIDEO_SORT_COLS:
+            order_by = "id"
+        order_direction = _DIRECTIONS.get(order_direction.lower(), "DESC")
+
+        where_clause, params = self._build_filter_query(status, query)
+        sql = (f"SELECT {_VIDEO_COLUMNS} FROM video_info{where_clause}"
+               f" ORDER BY {order_by} {order_direction} LIMIT %s")
+        params.append(int(size))
+
+        connection = self.pool.get_connection()
+        if connection is None:
+            return
+        cursor = None
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            cursor.execute(sql, tuple(params))
+            yield from cursor
+        except Error as e:
+            logger.error(f"Error streaming video page: {e}")
+        finally:
+            if cursor is not None:
+                cursor.close()
+            connection.close()
+
     def get_video_count(self, query=None, status=None):
-        
+
+        # 0. Cache theo filter, key gắn version counter nên insert mới
+        # tự vô hiệu mọi cache đếm cũ mà không cần SCAN xoá key
+        filter_hash = hashlib.md5(f"{status}|{query}".encode()).hexdigest()
+        cache_key = f"cnt:video:{self._video_count_version()}:{filter_hash}"
+        cached = self._cache_get_int(cache_key)
+        if cached is not None:
+            return cached
+
         # 1. Lấy điều kiện lọc (tái sử dụng logic để đảm bảo nhất quán)
         where_clause, params = self._build_filter_query(status, query)
         
@@ -165,76 +411,148 @@ class DBAccess:
                 with connection.cursor(dictionary=True) as cursor:
                     cursor.execute(sql, tuple(params))
                     result = cursor.fetchone()
-                    return result['total'] if result else 0
+                    total = result['total'] if result else 0
+                    self._cache_set_int(cache_key, total, COUNT_CACHE_TTL)
+                    return total
         except Error as e:
             logger.error(f"Error counting videos: {e}")
             return 0
         
     def get_highlight_page(self, video_id, page=1, size=10, order_by='id', order_direction='desc'):
         """
-        Lấy danh sách stats của một video cụ thể.
+        Lấy danh sách stats của một video cụ thể, kèm tổng số dòng trong
+        cùng một query (COUNT(*) OVER()).
         :param video_id: BẮT BUỘC.
+        :return: tuple (rows, total).
         """
         # 0. Kiểm tra tham số bắt buộc
         if not video_id:
             logger.error("get_video_stats: video_id is required")
-            return []
+            return [], 0
 
-        # 1. Whitelist các cột được phép sort (Bảo mật)
-        valid_columns = [
-            "id", "video_id", "vmaf_mean", "vmaf_min", 
-            "vmaf_max", "duration"
-        ]
-        
-        if order_by not in valid_columns:
+        # 1. Whitelist các cột được phép sort (Bảo mật) - frozenset/dict
+        # module-level nên chỉ còn hai hash lookup mỗi call
+        if order_by not in _STATS_SORT_COLS:
             order_by = "id"
-            
-        if order_direction.lower() not in ["asc", "desc"]:
-            order_direction = "desc"
 
-        # 2. Xây dựng Query
+        order_direction = _DIRECTIONS.get(order_direction.lower(), "DESC")
+
+        # 2. Xây dựng Query (memoize theo biến thể sort)
         # Lưu ý: video_id là bắt buộc nên ta để cứng trong WHERE
-        sql = f"SELECT * FROM video_stats WHERE video_id = %s ORDER BY {order_by} {order_direction}"
+        sql_key = ("highlight_page", order_by, order_direction)
+        sql = _SQL_CACHE.get(sql_key)
+        if sql is None:
+            sql = (f"SELECT {_STATS_COLUMNS}, COUNT(*) OVER() AS _total FROM video_stats"
+                   f" WHERE video_id = %s ORDER BY {order_by} {order_direction}"
+                   f" LIMIT %s OFFSET %s")
+            _SQL_CACHE[sql_key] = sql
 
         # 3. Phân trang
         limit = int(size)
         offset = (int(page) - 1) * limit
-        
-        sql += " LIMIT %s OFFSET %s"
-        
+
         # 4. Thực thi
         try:
             with self.pool.get_connection() as connection:
                 if not connection:
-                    return []
-                
-                with connection.cursor(dictionary=True) as cursor:
+                    return [], 0
+
+                # Cursor thường trả tuple: không cấp phát dict + hash
+                # key cho từng cột; model_construct bỏ qua validation
+                # pydantic (dữ liệu từ DB đã tin cậy)
+                with connection.cursor() as cursor:
                     # Truyền tham số theo đúng thứ tự: video_id -> limit -> offset
                     cursor.execute(sql, (video_id, limit, offset))
-                    return cursor.fetchall()
+                    rows = cursor.fetchall()
+                    if rows:
+                        total = int(rows[0][-1])
+                    elif offset > 0:
+                        # Trang vượt quá cuối: window rỗng nên
+                        # COUNT(*) OVER() không trả tổng - rơi về query
+                        # đếm riêng (hiếm, và đã có cache Redis)
+                        total = self.get_highlight_count(video_id)
+                    else:
+                        total = 0
+                    items = [
+                        HighlightStats.model_construct(
+                            id=r[0], video_id=r[1], vmaf_mean=r[2],
+                            vmaf_min=r[3], vmaf_max=r[4], duration=r[5],
+                            start_time=r[6], end_time=r[7]
+                        )
+                        for r in rows
+                    ]
+                    return items, total
 
         except Error as e:
             logger.error(f"Error fetching video_stats: {e}")
+            return [], 0
+
+    def get_highlight_page_after(self, video_id, cursor=None, size=10):
+        """
+        Phân trang kiểu keyset/seek cho stats của một video: lấy `size`
+        dòng có id < cursor, sắp xếp id DESC. Index seek O(log N) nên
+        chi phí không đổi ở mọi độ sâu trang; đường offset ở
+        get_highlight_page giữ lại cho client cũ.
+        :param cursor: id cuối cùng của trang trước (None = trang đầu).
+        """
+        if not video_id:
+            logger.error("get_highlight_page_after: video_id is required")
+            return []
+
+        params = [video_id]
+        where_clause = " WHERE video_id = %s"
+        if cursor is not None:
+            where_clause += " AND id < %s"
+            params.append(cursor)
+
+        sql = f"SELECT {_STATS_COLUMNS} FROM video_stats{where_clause} ORDER BY id DESC LIMIT %s"
+        params.append(int(size))
+
+        try:
+            with self.pool.get_connection() as connection:
+                if not connection:
+                    return []
+                with connection.cursor() as db_cursor:
+                    db_cursor.execute(sql, tuple(params))
+                    return [
+                        HighlightStats.model_construct(
+                            id=r[0], video_id=r[1], vmaf_mean=r[2],
+                            vmaf_min=r[3], vmaf_max=r[4], duration=r[5],
+                            start_time=r[6], end_time=r[7]
+                        )
+                        for r in db_cursor.fetchall()
+                    ]
+        except Error as e:
+            logger.error(f"Error fetching highlight page (keyset): {e}")
             return []
 
     def get_highlight_count(self, video_id):
         """
         Đếm tổng số dòng stats của một video_id (dùng để tính phân trang).
+        Cache ngắn hạn theo video_id; stats do worker ghi nên TTL ngắn
+        là đủ để giới hạn độ trễ.
         """
         if not video_id:
             return 0
-            
+
+        cache_key = f"cnt:highlight:{video_id}"
+        cached = self._cache_get_int(cache_key)
+        if cached is not None:
+            return cached
+
         sql = "SELECT COUNT(*) as total FROM video_stats WHERE video_id = %s"
 
         try:
             with self.pool.get_connection() as connection:
                 if not connection:
                     return 0
-                
+
                 with connection.cursor(dictionary=True) as cursor:
                     cursor.execute(sql, (video_id,))
                     result = cursor.fetchone()
-                    return result['total'] if result else 0
+                    total = result['total'] if result else 0
+                    self._cache_set_int(cache_key, total, COUNT_CACHE_TTL)
+                    return total
                     
         except Error as e:
             logger.error(f"Error counting video_stats: {e}")
@@ -242,48 +560,69 @@ class DBAccess:
     
     def get_frame_page(self, highlight_id, page=1, size=10, order_by='id', order_direction='asc'):
         """
-        Lấy danh sách frames của một highlight cụ thể.
+        Lấy danh sách frames của một highlight cụ thể, kèm tổng số dòng
+        trong cùng một query (COUNT(*) OVER()).
         :param highlight_id: BẮT BUỘC.
+        :return: tuple (rows, total).
         """
         # 0. Kiểm tra tham số bắt buộc
         if not highlight_id:
             logger.error("get_frame_page: highlight_id is required")
-            return []
+            return [], 0
 
-        # 1. Whitelist các cột được phép sort (Bảo mật)
-        valid_columns = [
-            "id", "highlight_id", "frame_num", "vmaf", 
-            "origin_url", "highlight_url"
-        ]
-        
-        if order_by not in valid_columns:
+        # 1. Whitelist các cột được phép sort (Bảo mật) - frozenset/dict
+        # module-level nên chỉ còn hai hash lookup mỗi call
+        if order_by not in _FRAME_SORT_COLS:
             order_by = "id"
-            
-        if order_direction.lower() not in ["asc", "desc"]:
-            order_direction = "asc"
 
-        # 2. Xây dựng Query
-        sql = f"SELECT * FROM frame_info WHERE highlight_id = %s ORDER BY {order_by} {order_direction}"
+        order_direction = _DIRECTIONS.get(order_direction.lower(), "ASC")
+
+        # 2. Xây dựng Query (memoize theo biến thể sort)
+        sql_key = ("frame_page", order_by, order_direction)
+        sql = _SQL_CACHE.get(sql_key)
+        if sql is None:
+            sql = (f"SELECT {_FRAME_COLUMNS}, COUNT(*) OVER() AS _total FROM frame_info"
+                   f" WHERE highlight_id = %s ORDER BY {order_by} {order_direction}"
+                   f" LIMIT %s OFFSET %s")
+            _SQL_CACHE[sql_key] = sql
 
         # 3. Phân trang
         limit = int(size)
         offset = (int(page) - 1) * limit
-        
-        sql += " LIMIT %s OFFSET %s"
-        
+
         # 4. Thực thi
         try:
             with self.pool.get_connection() as connection:
                 if not connection:
-                    return []
-                
-                with connection.cursor(dictionary=True) as cursor:
+                    return [], 0
+
+                # Cursor thường trả tuple: không cấp phát dict + hash
+                # key cho từng cột; model_construct bỏ qua validation
+                # pydantic (dữ liệu từ DB đã tin cậy)
+                with connection.cursor() as cursor:
                     cursor.execute(sql, (highlight_id, limit, offset))
-                    return cursor.fetchall()
+                    rows = cursor.fetchall()
+                    if rows:
+                        total = int(rows[0][-1])
+                    elif offset > 0:
+                        # Trang vượt quá cuối: window rỗng nên
+                        # COUNT(*) OVER() không trả tổng - rơi về query
+                        # đếm riêng (hiếm, và đã có cache Redis)
+                        total = self.get_frame_count(highlight_id)
+                    else:
+                        total = 0
+                    items = [
+                        FrameInfo.model_construct(
+                            id=r[0], highlight_id=r[1], frame_num=r[2],
+                            vmaf=r[3], origin_url=r[4], highlight_url=r[5]
+                        )
+                        for r in rows
+                    ]
+                    return items, total
 
         except Error as e:
             logger.error(f"Error fetching frames: {e}")
-            return []
+            return [], 0
 
     def get_frame_count(self, highlight_id):
         """
@@ -306,4 +645,59 @@ class DBAccess:
                     
         except Error as e:
             logger.error(f"Error counting frames: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+    ############################################################################
+    # Async variants: các handler FastAPI await những hàm này để call
+    # mysql-connector (blocking) chạy trên thread pool thay vì chặn event
+    # loop. Driver async thuần (aiomysql/asyncmy) sẽ thay thế toàn bộ lớp
+    # này, nhưng pool/cursor của cả cây code đang dựa trên mysql-connector
+    # nên các hàm sync vẫn là nguồn logic duy nhất.
+
+    async def get_job_by_id_async(self, job_id):
+        return await asyncio.to_thread(self.get_job_by_id, job_id)
+
+    async def insert_video_info_async(self, original_url, highlight_url, title):
+        return await asyncio.to_thread(
+            self.insert_video_info, original_url, highlight_url, title
+        )
+
+    async def insert_video_info_batch_async(self, rows):
+        return await asyncio.to_thread(self.insert_video_info_batch, rows)
+
+    async def get_video_page_async(self, page=1, size=10, order_by='id',
+                                   order_direction='desc', status=None, query=None):
+        return await asyncio.to_thread(
+            self.get_video_page, page, size, order_by, order_direction, status, query
+        )
+
+    async def get_video_page_after_async(self, cursor=None, size=10, status=None, query=None):
+        return await asyncio.to_thread(
+            self.get_video_page_after, cursor, size, status, query
+        )
+
+    async def get_video_count_async(self, query=None, status=None):
+        return await asyncio.to_thread(self.get_video_count, query, status)
+
+    async def get_highlight_page_async(self, video_id, page=1, size=10,
+                                       order_by='id', order_direction='desc'):
+        return await asyncio.to_thread(
+            self.get_highlight_page, video_id, page, size, order_by, order_direction
+        )
+
+    async def get_highlight_page_after_async(self, video_id, cursor=None, size=10):
+        return await asyncio.to_thread(
+            self.get_highlight_page_after, video_id, cursor, size
+        )
+
+    async def get_highlight_count_async(self, video_id):
+        return await asyncio.to_thread(self.get_highlight_count, video_id)
+
+    async def get_frame_page_async(self, highlight_id, page=1, size=10,
+                                   order_by='id', order_direction='asc'):
+        return await asyncio.to_thread(
+            self.get_frame_page, highlight_id, page, size, order_by, order_direction
+        )
+
+    async def get_frame_count_async(self, highlight_id):
+        return await asyncio.to_thread(self.get_frame_count, highlight_id)
\ No newline at end of file
@@ -1,43 +1,84 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from config.log import logger
+from fastapi.responses import ORJSONResponse
+from config.log import logger, init_logging
+from config.settings import CORS_ALLOW_ORIGINS, CORS_ALLOW_CREDENTIALS
 from api.video_routes import router as video_router
 from utils.redis_util import RedisClient
 from database.connection import MySQLConnectionPool
 from contextlib import asynccontextmanager
+import asyncio
+
+# Ping MySQL định kỳ để giữ connection/thread phía server luôn ấm
+# (tương đương minimumIdle của HikariCP)
+DB_KEEPALIVE_INTERVAL = 60  # seconds
+
+
+def _ping_db(pool):
+    """Issue SELECT 1 on one pooled connection"""
+    connection = pool.get_connection()
+    if connection is None:
+        return
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
+
+
+async def _db_keepalive(pool):
+    """Keep one pooled MySQL connection warm with a periodic SELECT 1"""
+    while True:
+        await asyncio.sleep(DB_KEEPALIVE_INTERVAL)
+        try:
+            await asyncio.to_thread(_ping_db, pool)
+        except Exception as e:
+            logger.warning(f"MySQL keepalive ping failed: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan (startup and shutdown)"""
     # Startup
+    init_logging()
     logger.info("FastAPI application starting...")
     
-    # Initialize Redis connection
+    # Both singletons were already built when api.video_routes was
+    # imported above (module-level DBAccess and RedisClient), so these
+    # calls just grab the shared instances - there is no construction
+    # left to overlap at this point
+    redis_client = RedisClient.get_instance()
+    app.state.db_pool = MySQLConnectionPool()
+
+    # Verify both backends concurrently: Redis PING alongside a MySQL
+    # warmup SELECT 1 (pre-opens a pooled connection before traffic).
+    # Failures here only log - the app starts degraded, and
+    # get_connection rebuilds the pool once MySQL is reachable again
     try:
-        redis_client = RedisClient.get_instance()
-        if redis_client.health_check():
+        redis_ok, _ = await asyncio.gather(
+            asyncio.to_thread(redis_client.health_check),
+            asyncio.to_thread(_ping_db, app.state.db_pool)
+        )
+        if redis_ok:
             logger.info("Redis connection established successfully")
         else:
             logger.error("Redis health check failed")
     except Exception as e:
-        logger.error(f"Failed to initialize Redis: {e}")
-        raise
-    
-    # Initialize MySQL connection pool
-    try:
-        app.state.db_pool = MySQLConnectionPool()
-        logger.info("MySQL connection pool initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize MySQL connection pool: {e}")
-        raise
-    
+        logger.warning(f"Startup warmup check failed: {e}")
+
+    # Keep MySQL connections warm between request bursts
+    keepalive_task = asyncio.create_task(_db_keepalive(app.state.db_pool))
+
     logger.info("FastAPI application started")
-    
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down FastAPI application...")
+
+    keepalive_task.cancel()
     
     # Close Redis connection
     try:
@@ -51,33 +92,55 @@ async def lifespan(app: FastAPI):
     logger.info("FastAPI application shutdown")
 
 
-# Create FastAPI application
+# Create FastAPI application. The outer app only carries `/` and
+# `/health`, so orchestrator probe storms skip the CORS middleware
+# entirely; all real routes live on the /api sub-application below.
 app = FastAPI(
     title="Highlight VMAF API",
     description="API for video highlight evaluation using VMAF",
     version="1.0.0",
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
+    docs_url=None,
+    redoc_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 
-# Configure CORS
-app.add_middleware(
+# Sub-application for the API proper: CORS is attached here only, and
+# docs stay reachable at /api/docs and /api/redoc as before
+api_app = FastAPI(
+    title="Highlight VMAF API",
+    description="API for video highlight evaluation using VMAF",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
+)
+
+
+# Configure CORS. Origins/credentials come from env (see
+# config/settings.py); with credentials off, preflight responses are
+# cacheable by the browser for max_age seconds, eliminating most
+# OPTIONS traffic
+api_app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this for production
-    allow_credentials=True,
+    allow_origins=CORS_ALLOW_ORIGINS,
+    allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 
-# Register routers
-app.include_router(video_router)
+# Register routers (router prefix is /v1 -> external path /api/v1)
+api_app.include_router(video_router)
+app.mount("/api", api_app)
 
 
-# Health check endpoint
+# Health check endpoint (GET + HEAD: kube probes can use HEAD and skip
+# the response body entirely)
 @app.get("/health", tags=["health"])
+@app.head("/health", tags=["health"])
 async def health_check():
     """Health check endpoint"""
     return {
@@ -1,3 +1,4 @@
+from enum import Enum
 from pydantic import BaseModel, Field
 from typing import Optional, Any, List, Literal
 
@@ -19,6 +20,41 @@ class PaginationData(BaseModel):
     items: List[Any] = Field(default_factory=list, description="List of items")
 
 
+class CursorPaginationData(BaseModel):
+    """Keyset (cursor) pagination response data - no totals, no COUNT(*)"""
+    nextCursor: Optional[int] = Field(None, description="Cursor for the next page (null when exhausted)")
+    items: List[Any] = Field(default_factory=list, description="List of items")
+
+
+# ==================== Query Param Enums ====================
+# Fixed sort-column sets: FastAPI rejects anything else during request
+# validation and the DB layer only ever sees known column names
+
+class VideoOrderBy(str, Enum):
+    """Sortable columns for the videos list endpoint"""
+    id = "id"
+    title = "title"
+    status = "status"
+
+
+class HighlightOrderBy(str, Enum):
+    """Sortable columns for the highlights list endpoint"""
+    id = "id"
+    video_id = "video_id"
+    vmaf_mean = "vmaf_mean"
+    vmaf_min = "vmaf_min"
+    vmaf_max = "vmaf_max"
+    duration = "duration"
+
+
+class FrameOrderBy(str, Enum):
+    """Sortable columns for the frames list endpoint"""
+    id = "id"
+    highlight_id = "highlight_id"
+    frame_num = "frame_num"
+    vmaf = "vmaf"
+
+
 # ==================== Request Models ====================
 
 class CreateVideoRequest(BaseModel):
@@ -63,6 +99,19 @@ class VideoInfo(BaseModel):
         from_attributes = True
 
 
+class FrameInfo(BaseModel):
+    """Frame information model"""
+    id: int
+    highlight_id: int
+    frame_num: Optional[int] = None
+    vmaf: Optional[float] = None
+    origin_url: Optional[str] = None
+    highlight_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
 class HighlightStats(BaseModel):
     """Highlight statistics model"""
     id: int
@@ -17,23 +17,24 @@ class RedisClient:
     _lock = threading.Lock()
     
     def __new__(cls):
-        """Ensure only one instance exists"""
+        """Create and fully initialize the single instance"""
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    instance.client = None
+                    instance.is_cluster = False # Cờ đánh dấu chế độ hoạt động
+                    instance._connect()
+                    instance._initialized = True
+                    # Chỉ publish sau khi connect thành công - thread khác
+                    # không bao giờ thấy instance nửa vời
+                    cls._instance = instance
         return cls._instance
-    
+
     def __init__(self):
-        """Initialize connection (only once)"""
-        if hasattr(self, '_initialized') and self._initialized:
-            return
-        
-        self._initialized = False
-        self.client = None
-        self.is_cluster = False # Cờ đánh dấu chế độ hoạt động
-        self._connect()
-        self._initialized = True
+        """Initialization lives in __new__; nothing to do per call"""
+        pass
     
     def _connect(self):
         """Internal connection method with Standalone/Cluster toggle"""
@@ -65,7 +66,7 @@ class RedisClient:
                 # CHẾ ĐỘ REDIS STANDALONE
                 self.is_cluster = False
                 logger.info(f"Connecting to Redis STANDALONE at {RedisConfig.HOST}:{RedisConfig.PORT}...")
-                self.client = Redis(**RedisConfig.get_connection_params())
+                self.client = Redis(connection_pool=RedisConfig.get_connection_pool())
             
             # Test connection
             self.client.ping()
@@ -155,6 +156,22 @@ class RedisClient:
             logger.error(f"Error GET key {key}: {e}")
             return None
     
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get multiple keys in one round-trip (MGET)"""
+        try:
+            return self._retry_operation(self.client.mget, keys)
+        except RedisError as e:
+            logger.error(f"Error MGET keys {keys}: {e}")
+            return [None] * len(keys)
+
+    def mset(self, mapping: dict) -> bool:
+        """Set multiple key-value pairs in one round-trip (MSET)"""
+        try:
+            return self._retry_operation(self.client.mset, mapping)
+        except RedisError as e:
+            logger.error(f"Error MSET: {e}")
+            return False
+
     def delete(self, key: str) -> bool:
         """Delete key"""
         try:
@@ -179,6 +196,14 @@ class RedisClient:
             logger.error(f"Error EXPIRE key {key}: {e}")
             return False
     
+    def incr(self, key: str, amount: int = 1) -> int:
+        """Increment integer value of key"""
+        try:
+            return self._retry_operation(self.client.incr, key, amount)
+        except RedisError as e:
+            logger.error(f"Error INCR key {key}: {e}")
+            return 0
+
     def get_expire(self, key: str) -> int:
         """Get TTL of key (-1 if no TTL, -2 if not exists)"""
         try:
@@ -189,18 +214,18 @@ class RedisClient:
     
     # ======================= List Operations =======================
     
-    def lpush(self, key: str, value: Any) -> int:
-        """Push value to left of list"""
+    def lpush(self, key: str, *values: Any) -> int:
+        """Push one or more values to left of list (variadic, single command)"""
         try:
-            return self._retry_operation(self.client.lpush, key, value)
+            return self._retry_operation(self.client.lpush, key, *values)
         except RedisError as e:
             logger.error(f"Error LPUSH key {key}: {e}")
             return 0
-    
-    def rpush(self, key: str, value: Any) -> int:
-        """Push value to right of list"""
+
+    def rpush(self, key: str, *values: Any) -> int:
+        """Push one or more values to right of list (variadic, single command)"""
         try:
-            return self._retry_operation(self.client.rpush, key, value)
+            return self._retry_operation(self.client.rpush, key, *values)
         except RedisError as e:
             logger.error(f"Error RPUSH key {key}: {e}")
             return 0
@@ -247,17 +272,36 @@ class RedisClient:
             logger.error(f"Error SREM key {key}: {e}")
             return 0
     
+    # ======================= Pipeline =======================
+
+    def pipeline(self, transaction: bool = False):
+        """
+        Get a pipeline to batch several commands into one round-trip.
+
+        Usage:
+            with redis_client.pipeline() as pipe:
+                pipe.lpush(...)
+                pipe.set(...)
+                results = pipe.execute()
+
+        Wrap execute() with _retry_operation when transient-error retry
+        is needed: redis_client._retry_operation(pipe.execute)
+        """
+        return self.client.pipeline(transaction=transaction)
+
     # ======================= Scan Keys =======================
     
     def scan_keys(self, pattern: str, limit: int = 1000) -> Set[str]:
         """Scan keys matching pattern (with limit to prevent memory issues)"""
+        # Each SCAN iteration is a full round-trip (remote Redis Cloud),
+        # so pass a big COUNT hint for server-side batches. scan_iter
+        # stays cluster-aware (iterates per-node cursors on RedisCluster),
+        # unlike driving raw SCAN with an integer cursor
         keys = set()
-        count = 0
         try:
-            for key in self.client.scan_iter(match=pattern, count=100):
+            for key in self.client.scan_iter(match=pattern, count=1000):
                 keys.add(key)
-                count += 1
-                if count >= limit:
+                if len(keys) >= limit:
                     logger.warning(f"⚠️ Scan stopped at limit {limit}")
                     break
         except RedisError as e:
@@ -280,4 +324,31 @@ class RedisClient:
         except RedisError as e:
             # Other errors: log and return None
             logger.error(f"⚠️ Redis error BLPOP key {key}: {e}")
+            return None
+
+    def blmpop(self, key: str, count: int = 16, timeout: int = 0) -> Optional[List[str]]:
+        """
+        Blocking pop of up to `count` elements from the left of a list
+        in ONE round-trip (BLMPOP, Redis >= 7.0).
+
+        Workers should drain a batch per call instead of looping blpop:
+        N jobs then cost 1 RTT instead of N.
+
+        Returns the list of popped values, or None on timeout.
+        """
+        try:
+            result = self.client.blmpop(timeout, 1, key, direction="LEFT", count=count)
+            if result is None:
+                return None  # Timed out with no data
+            # redis-py returns (key, [values])
+            return result[1]
+
+        except ConnectionError as e:
+            # CRITICAL: Only raise on real connection errors
+            logger.error(f"❌ Connection error BLMPOP key {key}: {e}")
+            raise
+
+        except RedisError as e:
+            # Other errors: log and return None
+            logger.error(f"⚠️ Redis error BLMPOP key {key}: {e}")
             return None
\ No newline at end of file